@@ -18,17 +18,48 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from ._version import __version__
 from .core import load_config
 from .instructions import generate_instructions
-from .resolver import resolve_config
-from .schema import validate_core_config
 from .style_loader import discover_style_path
 
+if TYPE_CHECKING:  # pragma: no cover - typing-only import
+    from .resolver import ResolutionResult
+
+# The resolver and schema modules pull in jsonschema, so commands import them on demand
+# to keep startup cheap for paths like ``--help`` and ``list-styles``.
+
 BUILTIN_STYLES = ["noun-verb", "verb-noun", "unix", "shell"]
+_LOCAL_CONFIG_NAMES = (".dclipse", "dclipse")
+# Above this many entries in the cwd, probing each candidate is cheaper than a full scan.
+_SCANDIR_LIMIT = 1000
+
+
+def _find_local_config() -> Path | None:
+    """Return the first of ``./.dclipse``/``./dclipse`` that is a file, or None.
+
+    Uses a single ``os.scandir`` of the cwd instead of one ``stat`` per candidate, falling
+    back to per-candidate checks when the directory is large or cannot be listed.
+    """
+    try:
+        with os.scandir(".") as it:
+            found: set[str] = set()
+            for n, entry in enumerate(it):
+                if n >= _SCANDIR_LIMIT:
+                    break
+                if entry.name in _LOCAL_CONFIG_NAMES and entry.is_file():
+                    found.add(entry.name)
+            else:
+                return next((Path(c) for c in _LOCAL_CONFIG_NAMES if c in found), None)
+    except OSError:  # pragma: no cover - unreadable cwd
+        pass
+    return next((Path(c) for c in _LOCAL_CONFIG_NAMES if Path(c).is_file()), None)
 
 
 def _discover_config_path(explicit: Path | None) -> Path:
@@ -49,12 +80,89 @@ def _discover_config_path(explicit: Path | None) -> Path:
         p = Path(env_val).expanduser()
         if p.exists():
             return p
-    for cand in (Path(".dclipse"), Path("dclipse")):
-        if cand.exists():
-            return cand
+    if local := _find_local_config():
+        return local
     raise FileNotFoundError("No config found. Use --config or set DCLIPSE_APP_CONFIG or place ./.dclipse")
 
 
+def _cache_dir() -> Path:
+    """Return the directory holding cached resolution results.
+
+    Honors ``DCLIPSE_CACHE_DIR``, then ``$XDG_CACHE_HOME/dclipse``, then ``~/.cache/dclipse``.
+    """
+    if env_val := os.getenv("DCLIPSE_CACHE_DIR"):
+        return Path(env_val).expanduser()
+    return Path(os.getenv("XDG_CACHE_HOME") or "~/.cache").expanduser() / "dclipse"
+
+
+# Modules whose code shapes a resolution result; their stats are part of the cache key.
+_CACHE_CODE_FILES = ("core.py", "resolver.py", "schema.py")
+# Packaged core schema (see ``schema._CORE_SCHEMA_NAME``), located without importing
+# ``.schema`` so a cache hit never loads jsonschema.
+_CORE_SCHEMA_NAME = "dclipse.schema.1.0.0.json"
+
+
+def _cache_key(path: Path) -> str:
+    """Build a cache key from the config file identity, package version, code, and core schema."""
+    from importlib import resources
+
+    st = path.stat()
+    parts = [f"{st.st_mtime_ns}:{st.st_size}", __version__]
+    here = Path(__file__).parent
+    core_schema = resources.files(__package__) / "schema" / _CORE_SCHEMA_NAME
+    for p in (*(here / name for name in _CACHE_CODE_FILES), Path(str(core_schema))):
+        try:
+            fst = p.stat()
+            parts.append(f"{fst.st_mtime_ns}:{fst.st_size}")
+        except OSError:  # pragma: no cover - package installed inside a zip
+            parts.append("")
+    return hashlib.blake2b(":".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_resolved(path: Path) -> ResolutionResult:
+    """Load, validate, and resolve the config at ``path``, reusing a cached result if unchanged.
+
+    Each config path has a single JSON entry under ``_cache_dir()``, stamped with
+    ``_cache_key``; a stale entry is overwritten. Results that JSON cannot represent
+    faithfully are not cached. Set ``DCLIPSE_NO_CACHE`` to bypass the cache entirely.
+    """
+    # resolver defers jsonschema to resolve_config, so a cache hit never imports it
+    from .resolver import ResolutionResult
+
+    if os.getenv("DCLIPSE_NO_CACHE"):
+        from .resolver import resolve_config
+
+        return resolve_config(load_config(path))
+
+    name = hashlib.blake2b(str(path.resolve()).encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = _cache_dir() / f"{name}.json"
+    key = _cache_key(path)
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached.get("key") == key:
+            return ResolutionResult(resolved=cached["resolved"], issues=cached["issues"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass  # missing, unreadable, or malformed entries are simply rebuilt
+
+    from .resolver import resolve_config
+
+    res = resolve_config(load_config(path))
+    try:
+        payload = json.dumps({"key": key, "resolved": res.resolved, "issues": res.issues})
+        cacheable = json.loads(payload)["resolved"] == res.resolved
+    except (TypeError, ValueError):
+        cacheable = False
+    if cacheable:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".tmp.{os.getpid()}")
+            tmp.write_text(payload, encoding="utf-8")
+            tmp.replace(cache_file)
+        except OSError:  # pragma: no cover - read-only or full cache dir
+            pass
+    return res
+
+
 def cmd_validate(config_path: str | None) -> int:
     """Validate the config file against the core schema.
 
@@ -65,9 +173,7 @@ def cmd_validate(config_path: str | None) -> int:
         0
     """
     path = _discover_config_path(Path(config_path) if config_path else None)
-    cfg = load_config(path)
-    validate_core_config(cfg)
-    resolve_config(cfg)
+    _load_resolved(path)
     print(f"OK: {path} validates against core schema")
     return 0
 
@@ -82,8 +188,7 @@ def cmd_explain(config_path: str | None, fmt: str) -> int:
         0
     """
     path = _discover_config_path(Path(config_path) if config_path else None)
-    cfg = load_config(path)
-    res = resolve_config(cfg)
+    res = _load_resolved(path)
     if fmt == "json":
         print(json.dumps(res.resolved, indent=2, sort_keys=True))
     else:
@@ -113,6 +218,8 @@ def cmd_generate(config_path: str | None, out_dir: str, style_file: str | None)
         >>> cmd_generate(None, "./generated_cli", None)  # doctest: +SKIP
         0
     """
+    from .schema import validate_core_config
+
     # Load to ensure config is valid; error early if invalid.
     path = _discover_config_path(Path(config_path) if config_path else None)
     cfg = load_config(path)
@@ -12,16 +12,99 @@ Examples:
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 from typing import IO, Any, Union
 
+# PyYAML is imported on first YAML use (see ``get_yaml``); ``None`` means unavailable.
+_NOT_LOADED: Any = object()
+yaml: Any = _NOT_LOADED
+
 try:
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover
-    yaml = None  # type: ignore
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore
+
+
+def get_yaml() -> Any:
+    """Return the ``yaml`` module, importing it on first use, or ``None`` if not installed.
+
+    Shared by the config, schema, and style loaders so PyYAML is imported at most once.
+
+    Examples:
+        >>> from dclipse.core import get_yaml
+        >>> yaml = get_yaml()
+        >>> yaml is None or hasattr(yaml, "safe_load")
+        True
+    """
+    global yaml
+    if yaml is _NOT_LOADED:
+        try:
+            import yaml as _yaml  # type: ignore
+        except Exception:  # pragma: no cover
+            _yaml = None  # type: ignore[assignment]
+        yaml = _yaml
+    return yaml
+
+
+def yaml_safe_load(yaml_mod: Any, stream: Any) -> Any:
+    """``safe_load`` via libyaml's ``CSafeLoader`` when PyYAML was built with it.
+
+    Args:
+        yaml_mod: The module returned by :func:`get_yaml`.
+        stream: YAML text or a text file handle.
 
+    Returns:
+        The parsed YAML document.
+
+    Examples:
+        >>> from dclipse.core import get_yaml, yaml_safe_load
+        >>> yaml_safe_load(get_yaml(), "a: 1")  # doctest: +SKIP
+        {'a': 1}
+    """
+    loader = getattr(yaml_mod, "CSafeLoader", None)
+    if loader is None:
+        return yaml_mod.safe_load(stream)
+    return yaml_mod.load(stream, Loader=loader)
 
-def load_config(source: Union[str, Path, IO[str]]) -> dict[str, Any]:
+
+# orjson turns integers wider than 64 bits into floats where the stdlib keeps them exact;
+# documents containing 19+ digit runs are left to the stdlib parser.
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """Decode JSON with ``orjson`` when installed, falling back to the stdlib parser.
+
+    Results never depend on whether orjson is installed: input orjson rejects (such as
+    ``NaN``/``Infinity``) or would parse lossily (very large integers) goes to ``json.loads``.
+
+    Args:
+        text: JSON document as text or UTF-8 bytes.
+
+    Returns:
+        The decoded JSON value.
+
+    Examples:
+        >>> from dclipse.core import json_loads
+        >>> json_loads(b'{"a": [1, 2]}')
+        {'a': [1, 2]}
+    """
+    if orjson is not None:
+        if isinstance(text, bytes):
+            lossy = _LONG_DIGITS_BYTES.search(text) is not None
+        else:
+            lossy = _LONG_DIGITS_STR.search(text) is not None
+        if not lossy:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass  # let the stdlib accept it or raise its own error
+    return json.loads(text)
+
+
+def load_config(source: Union[str, Path, IO[str], IO[bytes]]) -> dict[str, Any]:
     """Load a Dclipse config from a file path or file-like handle.
 
     Supports JSON; YAML if PyYAML is installed.
@@ -38,24 +121,33 @@ def load_config(source: Union[str, Path, IO[str]]) -> dict[str, Any]:
         text = source.read()  # type: ignore[assignment]
         return _loads_guess(text)
     p = Path(source)
-    text = p.read_text(encoding="utf-8")
     if p.suffix.lower() in {".yaml", ".yml"}:
-        if yaml is None:
+        yaml_mod = get_yaml()
+        if yaml_mod is None:
             raise RuntimeError("YAML support requires PyYAML; install it or use JSON.")
-        return yaml.safe_load(text) or {}
-    return json.loads(text)
+        return yaml_safe_load(yaml_mod, p.read_text(encoding="utf-8")) or {}
+    # JSON parsers accept raw UTF-8 bytes, which skips a decode/re-encode round trip.
+    return json_loads(p.read_bytes())
 
 
-def _loads_guess(text: str) -> dict[str, Any]:
+def _loads_guess(text: Union[str, bytes]) -> dict[str, Any]:
     """Decode ``text`` as JSON if it looks like JSON; otherwise YAML if available.
 
-    Raises a clear error if YAML is not available and the input does not look like JSON.
+    Accepts text or bytes (e.g. from a binary file handle). Raises a clear error if YAML
+    is not available and the input does not look like JSON.
     """
-    s = text.lstrip()
-    if s.startswith("{") or s.startswith("["):
-        return json.loads(text)
-    if yaml is None:
+    # Compare against literals of the matching type (mixing str/bytes warns under ``python -b``)
+    if isinstance(text, bytes):
+        head_b = text[:64].lstrip() or text.lstrip()
+        looks_json = head_b[:1] in (b"{", b"[")
+    else:
+        head = text[:64].lstrip() or text.lstrip()
+        looks_json = head[:1] in ("{", "[")
+    if looks_json:
+        return json_loads(text)
+    yaml_mod = get_yaml()
+    if yaml_mod is None:
         raise RuntimeError(
             "YAML support requires PyYAML; install it or provide JSON input.",
         )
-    return yaml.safe_load(text) or {}
+    return yaml_safe_load(yaml_mod, text) or {}
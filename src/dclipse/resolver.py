@@ -6,17 +6,16 @@ collects any constraint issues for reporting in CLI commands.
 
 from __future__ import annotations
 
-import copy
+import functools
 import os
 import re
 from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
-from .schema import validate_core_config
-
-_JSON_POINTER_RE = re.compile(r"^#(/[^/]+)*$")
 _VAR_RE = re.compile(r"\{\{\s*vars\.([a-zA-Z0-9_\-]+)\s*\}\}")
+_SCALAR_TYPES = (int, float, bool, type(None))
+_CONSTRAINT_KEYS = ("requires", "conflicts", "exactly_one_of", "at_least_one_of")
 
 
 @dataclass(frozen=True)
@@ -31,6 +30,28 @@ class ResolutionError(Exception):
     """Raised for invalid references or resolution-time errors."""
 
 
+@functools.lru_cache(maxsize=1024)
+def _pointer_tokens(pointer: str) -> tuple[str, ...]:
+    """Split a local JSON Pointer into unescaped reference tokens.
+
+    Decoding depends only on the pointer string, so results are cached per process.
+
+    Raises:
+        ResolutionError: If the pointer is not a local JSON Pointer or has empty segments.
+    """
+    if pointer == "#":
+        return ()
+    if not pointer.startswith("#/"):
+        raise ResolutionError(f"Unsupported $ref; must be local JSON Pointer, got: {pointer}")
+    tokens: list[str] = []
+    for token_enc in pointer[2:].split("/"):
+        if not token_enc:
+            raise ResolutionError(f"Unsupported $ref; must be local JSON Pointer, got: {pointer}")
+        # RFC 6901: decode ~1 before ~0 so "~01" becomes "~1", not "/"
+        tokens.append(token_enc.replace("~1", "/").replace("~0", "~") if "~" in token_enc else token_enc)
+    return tuple(tokens)
+
+
 def _json_pointer_get(doc: Mapping[str, Any], pointer: str) -> Any:
     """Resolve a local JSON Pointer ("#/...") within ``doc``.
 
@@ -44,13 +65,8 @@ def _json_pointer_get(doc: Mapping[str, Any], pointer: str) -> Any:
     Raises:
         ResolutionError: If the pointer is malformed or points to a non-existent path.
     """
-    if not _JSON_POINTER_RE.match(pointer):
-        raise ResolutionError(f"Unsupported $ref; must be local JSON Pointer, got: {pointer}")
     cur: Any = doc
-    if pointer == "#":
-        return cur
-    for token_enc in pointer.lstrip("#/").split("/"):
-        token = token_enc.replace("~1", "/").replace("~0", "~")
+    for token in _pointer_tokens(pointer):
         if not isinstance(cur, Mapping) or token not in cur:
             raise ResolutionError(f"Invalid $ref path segment: {token!r} in {pointer}")
         cur = cur[token]
@@ -58,23 +74,38 @@ def _json_pointer_get(doc: Mapping[str, Any], pointer: str) -> Any:
 
 
 def _merge(a: Mapping[str, Any], b: Mapping[str, Any]) -> dict[str, Any]:
-    """Deep-merge two mappings with ``b`` overriding ``a`` recursively for dicts."""
+    """Deep-merge two mappings with ``b`` overriding ``a`` recursively for dicts.
+
+    Only merged dicts are rebuilt; other values are shared with the inputs. This is safe
+    because resolution renders the result into fresh containers and never mutates it.
+    Nested levels are merged from an explicit stack rather than by recursion.
+    """
     out: dict[str, Any] = dict(a)
-    for k, v in b.items():
-        if k in out and isinstance(out[k], dict) and isinstance(v, Mapping):
-            out[k] = _merge(out[k], v)
-        else:
-            out[k] = copy.deepcopy(v)
+    stack: list[tuple[dict[str, Any], Mapping[str, Any]]] = [(out, b)]
+    while stack:
+        tgt, src = stack.pop()
+        for k, v in src.items():
+            cur = tgt.get(k)
+            if isinstance(cur, dict) and isinstance(v, Mapping):
+                merged: dict[str, Any] = dict(cur)
+                tgt[k] = merged
+                stack.append((merged, v))
+            else:
+                tgt[k] = v
     return out
 
 
-def _render_vars_in_str(s: str, vars_map: Mapping[str, Any], *, id_value: str | None = None) -> str:
-    """Render ``{{vars.KEY}}`` and optional ``{{id}}`` placeholders in a string."""
+def _render_vars_in_str(s: str, vars_map: Mapping[str, str], *, id_value: str | None = None) -> str:
+    """Render ``{{vars.KEY}}`` and optional ``{{id}}`` placeholders in a string.
+
+    ``vars_map`` holds pre-stringified values (see ``_stringify_vars``); unknown keys are
+    left as-is.
+    """
+    if "{{" not in s:
+        return s
 
     def rep(m: re.Match[str]) -> str:
-        key = m.group(1)
-        val = vars_map.get(key)
-        return str(val) if val is not None else m.group(0)
+        return vars_map.get(m.group(1), m.group(0))
 
     s2 = _VAR_RE.sub(rep, s)
     if id_value is not None:
@@ -82,74 +113,127 @@ def _render_vars_in_str(s: str, vars_map: Mapping[str, Any], *, id_value: str |
     return s2
 
 
-def _render_vars_in_obj(obj: Any, vars_map: Mapping[str, Any], *, id_value: str | None = None) -> Any:
-    """Recursively render placeholders within strings nested in ``obj``."""
-    if isinstance(obj, str):
+def _stringify_vars(vars_map: Mapping[str, Any]) -> dict[str, str]:
+    """Convert ``shared_defs.vars`` values to strings once, dropping ``None`` entries."""
+    return {k: str(v) for k, v in vars_map.items() if v is not None}
+
+
+def _render_vars_in_obj(obj: Any, vars_map: Mapping[str, str], *, id_value: str | None = None) -> Any:
+    """Recursively render placeholders within strings nested in ``obj``.
+
+    Dispatches on exact ``type()`` for the JSON built-ins and only falls back to
+    ``isinstance`` for subclasses.
+    """
+    t: type | None = type(obj)
+    if t in _SCALAR_TYPES:
+        return obj
+    if t is not str and t is not dict and t is not list:
+        t = next((base for base in (str, dict, list) if isinstance(obj, base)), None)
+    if t is str:
         return _render_vars_in_str(obj, vars_map, id_value=id_value)
-    if isinstance(obj, list):
-        return [_render_vars_in_obj(x, vars_map, id_value=id_value) for x in obj]
-    if isinstance(obj, dict):
+    if t is dict:
         return {k: _render_vars_in_obj(v, vars_map, id_value=id_value) for k, v in obj.items()}
+    if t is list:
+        return [_render_vars_in_obj(x, vars_map, id_value=id_value) for x in obj]
     return obj
 
 
-def _collect_selected_keys(section: Mapping[str, Any]) -> list[str]:
+def _collect_selected_keys(*sections: Mapping[str, Any]) -> list[str]:
     """Collect option/positional keys used to evaluate constraints."""
-    return list(section.keys())
+    return [key for section in sections for key in section]
 
 
 def _validate_constraints(selected: list[str], constraints: Mapping[str, Any]) -> list[str]:
     """Evaluate constraint rules and return human-readable issue strings."""
-    errs: list[str] = []
     sel = set(selected)
-    req = constraints.get("requires", [])
-    for name in req:
-        if name not in sel:
-            errs.append(f"requires: missing {name}")
-    for pair in constraints.get("conflicts", []):
-        a, b = pair[0], pair[1]
-        if a in sel and b in sel:
-            errs.append(f"conflicts: {a} vs {b}")
+    errs = [f"requires: missing {name}" for name in constraints.get("requires", []) if name not in sel]
+    errs += [f"conflicts: {a} vs {b}" for a, b, *_ in constraints.get("conflicts", []) if a in sel and b in sel]
     for group in constraints.get("exactly_one_of", []):
-        n = sum(1 for k in group if k in sel)
+        n = sum(map(sel.__contains__, group))
         if n != 1:
             errs.append(f"exactly_one_of violation: {group} present={n}")
-    for group in constraints.get("at_least_one_of", []):
-        n = sum(1 for k in group if k in sel)
-        if n < 1:
-            errs.append(f"at_least_one_of violation: {group}")
+    errs += [f"at_least_one_of violation: {g}" for g in constraints.get("at_least_one_of", []) if sel.isdisjoint(g)]
     return errs
 
 
-def _apply_refs(doc: dict[str, Any]) -> dict[str, Any]:
-    """Walk objects/actions and expand local ``$ref`` with shallow-merge overrides."""
+def _expand_ref(doc: Mapping[str, Any], node: Any, ref_cache: dict[str, Mapping[str, Any]]) -> Any:
+    """Expand a local ``$ref`` on ``node`` against ``doc``, merging sibling keys as overrides.
+
+    Pointer targets are memoized in ``ref_cache`` so entries sharing a base resolve it once.
+    """
+    if not (isinstance(node, Mapping) and "$ref" in node):
+        return node
+    ref = str(node["$ref"])
+    base = ref_cache.get(ref)
+    if base is None:
+        target = _json_pointer_get(doc, ref)
+        if not isinstance(target, Mapping):
+            raise ResolutionError(f"$ref must point to a mapping: {ref}")
+        base = ref_cache[ref] = target
+    return _merge(base, {k: v for k, v in node.items() if k != "$ref"})
+
+
+def _node_issues(node: Mapping[str, Any]) -> list[str]:
+    """Evaluate a resolved object/action's constraints against its option/positional keys."""
+    constraints = node.get("constraints")
+    if not isinstance(constraints, Mapping) or not any(constraints.get(k) for k in _CONSTRAINT_KEYS):
+        return []
+    opts = node.get("options", {}) if isinstance(node.get("options"), Mapping) else {}
+    poss = node.get("positionals", {}) if isinstance(node.get("positionals"), Mapping) else {}
+    selected = _collect_selected_keys(opts, poss)
+    return _validate_constraints(selected, constraints)
+
+
+def _resolve_section(
+    doc: Mapping[str, Any],
+    section: Mapping[str, Any],
+    vars_map: Mapping[str, str],
+    issues: list[str],
+    *,
+    label: str,
+    nested_actions: bool,
+    ref_cache: dict[str, Mapping[str, Any]],
+) -> dict[str, Any]:
+    """Resolve an ``objects``/``actions`` mapping in a single pass.
+
+    Each entry has its ``$ref`` expanded, its placeholders rendered, and its constraints
+    evaluated as it is built. When ``nested_actions`` is set, an entry's ``actions`` mapping
+    is resolved recursively the same way.
 
-    def process_mapping(mapping: dict[str, Any]) -> dict[str, Any]:
-        out: dict[str, Any] = {}
-        for key, val in mapping.items():
-            if isinstance(val, Mapping) and "$ref" in val:
-                base = _json_pointer_get(doc, str(val["$ref"]))
-                if not isinstance(base, Mapping):
-                    raise ResolutionError(f"$ref must point to a mapping: {val['$ref']}")
-                merged = _merge(copy.deepcopy(base), {k: v for k, v in val.items() if k != "$ref"})
-                out[key] = merged
+    Args:
+        doc: The raw document that ``$ref`` pointers are resolved against.
+        section: The mapping of ids to object/action definitions.
+        vars_map: Stringified variables available to ``{{vars.*}}`` placeholders.
+        issues: Output list receiving constraint issue strings.
+        label: Issue prefix for entries of this section, e.g. ``"object "``.
+        nested_actions: Whether entries may hold their own ``actions`` mapping.
+        ref_cache: Per-resolution memo of ``$ref`` pointer targets.
+    """
+    out: dict[str, Any] = {}
+    for node_id, raw_node in section.items():
+        node = _expand_ref(doc, raw_node, ref_cache)
+        if not isinstance(node, Mapping):
+            out[node_id] = _render_vars_in_obj(node, vars_map)
+            continue
+        child_issues: list[str] = []
+        resolved: dict[str, Any] = {}
+        for key, val in node.items():
+            if nested_actions and key == "actions" and isinstance(val, Mapping):
+                resolved[key] = _resolve_section(
+                    doc,
+                    val,
+                    vars_map,
+                    child_issues,
+                    label=f"{label}{node_id} action ",
+                    nested_actions=False,
+                    ref_cache=ref_cache,
+                )
             else:
-                out[key] = copy.deepcopy(val)
-        return out
-
-    resolved: dict[str, Any] = copy.deepcopy(doc)
-    if "objects" in resolved and isinstance(resolved["objects"], Mapping):
-        objs: dict[str, Any] = process_mapping(dict(resolved["objects"]))
-        for key, obj in list(objs.items()):
-            if isinstance(obj, Mapping) and "actions" in obj and isinstance(obj["actions"], Mapping):
-                obj_dict: dict[str, Any] = dict(obj)
-                obj_dict["actions"] = process_mapping(dict(obj["actions"]))
-                objs[key] = obj_dict
-        resolved["objects"] = objs
-    if "actions" in resolved and isinstance(resolved["actions"], Mapping):
-        resolved["actions"] = process_mapping(dict(resolved["actions"]))
-    # global options already direct; options under nodes may have $ref which process_mapping handled
-    return resolved
+                resolved[key] = _render_vars_in_obj(val, vars_map)
+        issues += [f"{label}{node_id}: {e}" for e in _node_issues(resolved)]
+        issues += child_issues
+        out[node_id] = resolved
+    return out
 
 
 def resolve_config(raw: dict[str, Any], *, env: Mapping[str, str] | None = None) -> ResolutionResult:
@@ -157,9 +241,8 @@ def resolve_config(raw: dict[str, Any], *, env: Mapping[str, str] | None = None)
 
     Steps:
       - Validate against the core schema.
-      - Expand local ``$ref`` and merges.
-      - Render ``{{vars.*}}`` and ``{{id}}`` placeholders.
-      - Collect constraint issues for objects and actions.
+      - In one walk over the document: expand local ``$ref`` and merges, render
+        ``{{vars.*}}`` placeholders, and collect constraint issues for objects and actions.
 
     Args:
         raw: The input configuration mapping.
@@ -174,50 +257,42 @@ def resolve_config(raw: dict[str, Any], *, env: Mapping[str, str] | None = None)
         >>> isinstance(res.resolved, dict) and isinstance(res.issues, list)
         True
     """
+    # Deferred so ResolutionResult can be used (e.g. for cached CLI results) without jsonschema.
+    from .schema import validate_core_config
+
     validate_core_config(raw)
     env = env or os.environ
-    doc = _apply_refs(raw)
-
-    vars_map: Mapping[str, Any] = {}
-    if isinstance(doc.get("shared_defs"), Mapping) and isinstance(doc["shared_defs"].get("vars"), Mapping):
-        vars_map = doc["shared_defs"]["vars"]  # type: ignore[assignment]
-
-    # Render vars across top-level string fields and within objects/actions descriptions
-    doc = _render_vars_in_obj(doc, vars_map)
-
-    issues: list[str] = []
-
-    # Validate constraints at object and action levels using present option/positional keys
-    if isinstance(doc.get("objects"), Mapping):
-        for obj_id, obj in doc["objects"].items():
-            if not isinstance(obj, Mapping):
-                continue
-            opts = obj.get("options", {}) if isinstance(obj.get("options"), Mapping) else {}
-            poss = obj.get("positionals", {}) if isinstance(obj.get("positionals"), Mapping) else {}
-            selected = _collect_selected_keys({**opts, **poss})
-            if isinstance(obj.get("constraints"), Mapping):
-                issues += [f"object {obj_id}: {e}" for e in _validate_constraints(selected, obj["constraints"])]
-            if isinstance(obj.get("actions"), Mapping):
-                for act_id, act in obj["actions"].items():
-                    if not isinstance(act, Mapping):
-                        continue
-                    aopts = act.get("options", {}) if isinstance(act.get("options"), Mapping) else {}
-                    apos = act.get("positionals", {}) if isinstance(act.get("positionals"), Mapping) else {}
-                    sel = _collect_selected_keys({**aopts, **apos})
-                    if isinstance(act.get("constraints"), Mapping):
-                        issues += [
-                            f"object {obj_id} action {act_id}: {e}"
-                            for e in _validate_constraints(sel, act["constraints"])
-                        ]
-
-    if isinstance(doc.get("actions"), Mapping):
-        for act_id, act in doc["actions"].items():
-            if not isinstance(act, Mapping):
-                continue
-            aopts = act.get("options", {}) if isinstance(act.get("options"), Mapping) else {}
-            apos = act.get("positionals", {}) if isinstance(act.get("positionals"), Mapping) else {}
-            sel = _collect_selected_keys({**aopts, **apos})
-            if isinstance(act.get("constraints"), Mapping):
-                issues += [f"action {act_id}: {e}" for e in _validate_constraints(sel, act["constraints"])]
-
-    return ResolutionResult(resolved=doc, issues=issues)
+
+    vars_map: dict[str, str] = {}
+    if isinstance(raw.get("shared_defs"), Mapping) and isinstance(raw["shared_defs"].get("vars"), Mapping):
+        vars_map = _stringify_vars(raw["shared_defs"]["vars"])
+
+    ref_cache: dict[str, Mapping[str, Any]] = {}
+    object_issues: list[str] = []
+    action_issues: list[str] = []
+    doc: dict[str, Any] = {}
+    for key, val in raw.items():
+        if key == "objects" and isinstance(val, Mapping):
+            doc[key] = _resolve_section(
+                raw,
+                val,
+                vars_map,
+                object_issues,
+                label="object ",
+                nested_actions=True,
+                ref_cache=ref_cache,
+            )
+        elif key == "actions" and isinstance(val, Mapping):
+            doc[key] = _resolve_section(
+                raw,
+                val,
+                vars_map,
+                action_issues,
+                label="action ",
+                nested_actions=False,
+                ref_cache=ref_cache,
+            )
+        else:
+            doc[key] = _render_vars_in_obj(val, vars_map)
+
+    return ResolutionResult(resolved=doc, issues=object_issues + action_issues)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import functools
 from dataclasses import dataclass
 from importlib import resources
 from typing import TYPE_CHECKING, Any
@@ -11,13 +11,10 @@ if TYPE_CHECKING:  # pragma: no cover - typing-only imports
     from importlib.resources.abc import Traversable
     from pathlib import Path
 
-try:
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover - optional
-    yaml = None  # YAML is optional; tests will skip if missing
-
 from jsonschema import Draft202012Validator, ValidationError  # type: ignore
 
+from .core import get_yaml, json_loads, yaml_safe_load
+
 _SCHEMA_DIR = "schema"
 _CORE_SCHEMA_NAME = "dclipse.schema.1.0.0.json"
 _STYLE_SCHEMA_NAME = "dclipse_style.schema.1.0.0.json"
@@ -50,9 +47,8 @@ def get_schema_paths() -> SchemaPaths:
 
 
 def _load_json(path: Traversable) -> dict[str, Any]:
-    """Load a JSON document from a package resource path."""
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load a JSON document from a package resource or filesystem path."""
+    return json_loads(path.read_bytes())  # type: ignore[no-any-return]
 
 
 def _load_json_or_yaml(path: Path) -> dict[str, Any]:
@@ -66,32 +62,36 @@ def _load_json_or_yaml(path: Path) -> dict[str, Any]:
     if suffix in (".json",):
         return _load_json(path)
     if suffix in (".yaml", ".yml"):
+        yaml = get_yaml()
         if yaml is None:
             raise RuntimeError("PyYAML is required to load YAML style files. Install 'pyyaml'.")
         with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml_safe_load(yaml, f)
             if not isinstance(data, dict):
                 raise ValueError("YAML style file must decode to a mapping.")
             return data
     raise ValueError(f"Unsupported style file extension: {suffix!r}. Use .json, .yaml, or .yml.")
 
 
-def _validator(schema_path: Traversable) -> Draft202012Validator:
-    """Build a JSON Schema validator for the given packaged schema."""
-    schema = _load_json(schema_path)
+@functools.cache
+def _validator(kind: str) -> Draft202012Validator:
+    """Build (once per process) a JSON Schema validator for a packaged schema.
+
+    Args:
+        kind: Either ``"core"`` or ``"style"``, naming a field of ``SchemaPaths``.
+    """
+    schema = _load_json(getattr(get_schema_paths(), kind))
     return Draft202012Validator(schema)
 
 
 def validate_core_config(config: dict[str, Any]) -> None:
     """Validate a resolved dclipse config against the authoritative core schema."""
-    v = _validator(get_schema_paths().core)
-    v.validate(config)
+    _validator("core").validate(config)
 
 
 def validate_style_config(style_obj: dict[str, Any]) -> None:
     """Validate a declarative style object (JSON/YAML) against the style schema."""
-    v = _validator(get_schema_paths().style)
-    v.validate(style_obj)
+    _validator("style").validate(style_obj)
 
 
 def load_and_validate_style_file(path: Path) -> dict[str, Any]:
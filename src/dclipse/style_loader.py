@@ -6,17 +6,21 @@ declarative JSON/YAML style files validated against the style schema.
 
 from __future__ import annotations
 
-import importlib.util
+import copy
+import functools
+import itertools
+import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
+from ._version import __version__
+from .core import json_loads
+
 if TYPE_CHECKING:  # pragma: no cover - typing-only import
     from types import ModuleType
 
-from .schema import load_and_validate_style_file
-
 
 class RenderFn(Protocol):
     """Protocol for style render functions."""
@@ -40,6 +44,8 @@ class LoadedStyle:
     is_python_module: bool
     module: ModuleType | None
     config: dict[str, Any] | None
+    # ``render`` as validated by load_style; looked up from ``module`` when not provided.
+    _render_fn: RenderFn | None = field(default=None, repr=False, compare=False)
 
     def render(self) -> RenderFn:
         """Return the ``render`` callable from the loaded Python module.
@@ -48,6 +54,8 @@ class LoadedStyle:
             RuntimeError: If this style is declarative and not a Python module.
             TypeError: If the module lacks a callable ``render`` symbol.
         """
+        if self._render_fn is not None:
+            return self._render_fn
         if not self.is_python_module:
             raise RuntimeError(
                 "Declarative style files declare rules but do not implement 'render'. "
@@ -65,8 +73,22 @@ class LoadedStyle:
 
 
 def _import_py_module(path: Path) -> ModuleType:
-    """Import a Python module by file path without adding to sys.path."""
-    spec = importlib.util.spec_from_file_location(path.stem, str(path))
+    """Import a Python module by file path without adding to sys.path.
+
+    Modules are cached per ``(path, mtime_ns, size)``, so loading an unchanged style file
+    again returns the already-executed module while an edited file is re-imported.
+    """
+    st = path.stat()
+    return _import_py_module_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _import_py_module_cached(path_str: str, mtime_ns: int, size: int) -> ModuleType:
+    """Execute the style module at ``path_str``; the stat fields only key the cache."""
+    import importlib.util
+
+    path = Path(path_str)
+    spec = importlib.util.spec_from_file_location(path.stem, path_str)
     if spec is None or spec.loader is None:
         raise ImportError(f"Cannot import style module from {path}")
     module = importlib.util.module_from_spec(spec)
@@ -75,12 +97,40 @@ def _import_py_module(path: Path) -> ModuleType:
 
 
 def _discover_project_root(start: Path) -> Path:
-    """Heuristic: git repo root ('.git' folder) or fallback to start."""
-    cur = start.resolve()
-    for parent in [cur, *cur.parents]:
-        if (parent / ".git").exists():
-            return parent
-    return cur
+    """Heuristic: git repo root ('.git' folder) or fallback to start.
+
+    Results are memoized per start directory and ``.git`` probes per parent directory, so
+    repeated lookups, and lookups from sibling or nested directories, skip the stat walk.
+    """
+    return Path(_discover_project_root_cached(str(start.absolute())))
+
+
+@functools.lru_cache(maxsize=256)
+def _discover_project_root_cached(start_str: str) -> str:
+    """Walk up from the absolute directory ``start_str`` to the nearest ``.git`` parent."""
+    cur = Path(start_str).resolve()
+    # Iterate parents lazily so ancestors above the repo root are never materialized
+    for parent in itertools.chain((cur,), cur.parents):
+        if _has_git_entry(str(parent)):
+            return str(parent)
+    return str(cur)
+
+
+# Bounded like _discover_project_root_cached; probes are shared by all project-root walks.
+@functools.lru_cache(maxsize=256)
+def _has_git_entry(directory: str) -> bool:
+    """Return whether ``directory`` contains ``.git``, probing each directory once."""
+    return (Path(directory) / ".git").exists()
+
+
+def _absolute(path: Path) -> Path:
+    """Return ``path`` unchanged if absolute, else resolved, avoiding a ``realpath`` walk."""
+    return path if path.is_absolute() else path.resolve()
+
+
+_STYLE_FILE_PREFIX = ".dclipse_style."
+# Project-root style file names, in discovery priority order.
+_STYLE_FILE_NAMES = tuple(f"{_STYLE_FILE_PREFIX}{ext}" for ext in ("py", "json", "yaml", "yml"))
 
 
 def discover_style_path(
@@ -95,27 +145,79 @@ def discover_style_path(
       1) --style-file (explicit_path)
       2) $DCLIPSE_STYLE_FILE
       3) ./.dclipse_style{.py,.json,.yaml,.yml} in project root.
+
+    Returned paths are absolute; already-absolute inputs are returned without resolving
+    symlinks.
+
+    The project root lookup is memoized, but the env var and the root directory are
+    checked on every call so newly created, higher-priority style files take effect.
     """
     if explicit_path:
-        return explicit_path.resolve()
+        return _absolute(explicit_path)
+    return _search_style_path(os.getenv(env_var), cwd or Path.cwd())
+
 
-    env_val = os.getenv(env_var)
+def _search_style_path(env_val: str | None, start: Path) -> Path | None:
+    """Search the env-var path, then the project root of ``start``, for a style file."""
     if env_val:
-        p = Path(env_val).expanduser()
+        p = Path(env_val)
+        if env_val.startswith("~"):  # expanduser may consult HOME or the passwd database
+            p = p.expanduser()
         if p.exists():
-            return p.resolve()
+            return _absolute(p)
+
+    root = _discover_project_root(start)
+    # One directory read instead of a stat per candidate name
+    try:
+        with os.scandir(root) as it:
+            names = {e.name for e in it if e.name.startswith(_STYLE_FILE_PREFIX)}
+    except OSError:  # pragma: no cover - unreadable project root
+        return None
+    # ``root`` is already resolved, so the joined path needs no further resolution
+    return next((root / name for name in _STYLE_FILE_NAMES if name in names), None)
+
+
+def _load_style_config(path: Path) -> dict[str, Any]:
+    """Load and validate a declarative style file.
+
+    When ``DCLIPSE_STYLE_CACHE`` is set, the validated config is stored in a
+    ``<name>.cache.json`` sidecar stamped with the source's ``mtime_ns``/size and the
+    dclipse version; a matching sidecar is returned without re-parsing or re-validating.
+    Configs that do not survive a JSON round trip are never written to the sidecar.
+    """
+    # The schema module (and jsonschema) is only needed for declarative styles.
+    from .schema import load_and_validate_style_file
+
+    if not os.getenv("DCLIPSE_STYLE_CACHE"):
+        return load_and_validate_style_file(path)
 
-    root = _discover_project_root(cwd or Path.cwd())
-    for cand in (
-        root / ".dclipse_style.py",
-        root / ".dclipse_style.json",
-        root / ".dclipse_style.yaml",
-        root / ".dclipse_style.yml",
-    ):
-        if cand.exists():
-            return cand.resolve()
+    st = path.stat()
+    stamp = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "version": __version__}
+    sidecar = path.with_name(path.name + ".cache.json")
+    try:
+        data = json_loads(sidecar.read_bytes())
+        if isinstance(data, dict) and all(data.get(k) == v for k, v in stamp.items()):
+            return data["cfg"]  # type: ignore[no-any-return]
+    except (OSError, ValueError, KeyError):
+        pass  # missing or unreadable sidecar; rebuild below
 
-    return None
+    cfg = load_and_validate_style_file(path)
+    # YAML can produce values JSON cannot represent faithfully (dates, non-string keys);
+    # such configs are not cached so warm and cold loads always agree.
+    try:
+        payload = json.dumps({**stamp, "cfg": cfg})
+        cacheable = json.loads(payload)["cfg"] == cfg
+    except (TypeError, ValueError):
+        cacheable = False
+    if cacheable:
+        # Write a temp file and rename it over the sidecar so readers never see a partial file
+        tmp = sidecar.with_name(f"{sidecar.name}.tmp.{os.getpid()}")
+        try:
+            tmp.write_text(payload, encoding="utf-8")
+            tmp.replace(sidecar)
+        except OSError:  # pragma: no cover - read-only style directory
+            tmp.unlink(missing_ok=True)
+    return cfg
 
 
 def load_style(explicit_path: Path | None = None) -> LoadedStyle:
@@ -125,6 +227,9 @@ def load_style(explicit_path: Path | None = None) -> LoadedStyle:
       - Python module at .py with a callable `render(...)`.
       - JSON/YAML file validated against the style schema.
 
+    Loaded styles are reused while the file's mtime and size are unchanged; each call
+    gets its own copy of a declarative ``config``, so callers may mutate it freely.
+
     Examples:
         >>> from dclipse.style_loader import load_style  # doctest: +SKIP
         >>> style = load_style()  # doctest: +SKIP
@@ -138,6 +243,18 @@ def load_style(explicit_path: Path | None = None) -> LoadedStyle:
             "or create ./.dclipse_style.(py|json|yaml|yml) in the project root.",
         )
 
+    st = path.stat()
+    style = _load_style_cached(str(path), st.st_mtime_ns, st.st_size)
+    if style.config is None:
+        return style
+    return replace(style, config=copy.deepcopy(style.config))
+
+
+# Bounded like _import_py_module_cached so evicted modules are not kept alive here.
+@functools.lru_cache(maxsize=32)
+def _load_style_cached(path_str: str, mtime_ns: int, size: int) -> LoadedStyle:
+    """Import or load-and-validate the style file; the stat fields only key the cache."""
+    path = Path(path_str)
     if path.suffix.lower() == ".py":
         mod = _import_py_module(path)
         # Validate that the module exports a callable render at load time
@@ -149,9 +266,16 @@ def load_style(explicit_path: Path | None = None) -> LoadedStyle:
                 "'render(resolved_model, *, package_name, engine)'.",
             )
         name = getattr(mod, "STYLE_NAME", path.stem)
-        return LoadedStyle(name=name, source=path, is_python_module=True, module=mod, config=None)
+        return LoadedStyle(
+            name=name,
+            source=path,
+            is_python_module=True,
+            module=mod,
+            config=None,
+            _render_fn=fn,  # type: ignore[arg-type]
+        )
 
     # JSON/YAML declarative file
-    cfg = load_and_validate_style_file(path)
+    cfg = _load_style_config(path)
     name = str(cfg.get("name", path.stem))
     return LoadedStyle(name=name, source=path, is_python_module=False, module=None, config=cfg)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only import
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep resolution caches written by CLI commands out of the real ``~/.cache``."""
+    monkeypatch.setenv("DCLIPSE_CACHE_DIR", str(tmp_path / ".dclipse-cache"))
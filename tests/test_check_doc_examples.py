@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "tools" / "check_doc_examples.py"
+
+
+@pytest.fixture
+def checker(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    spec = importlib.util.spec_from_file_location("check_doc_examples", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    # A scratch copy stands in for the checker script, so its mtime can change freely
+    script = tmp_path / "check_doc_examples.py"
+    script.write_text("# checker\n", encoding="utf-8")
+    monkeypatch.setattr(mod, "__file__", str(script))
+    monkeypatch.setenv("DCLIPSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("DCLIPSE_NO_CACHE", raising=False)
+    return mod
+
+
+@pytest.fixture
+def module_file(tmp_path: Path) -> Path:
+    p = tmp_path / "core.py"
+    p.write_text('def api():\n    """Does a thing."""\n', encoding="utf-8")
+    return p
+
+
+def _count_checks(checker, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    check_file = checker.check_file
+
+    def counting(path: Path) -> list[str]:
+        calls.append(path)
+        return check_file(path)
+
+    monkeypatch.setattr(checker, "check_file", counting)
+    return calls
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_cache_hit_skips_check_file(checker, module_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = checker._check_files_cached([module_file])
+    assert len(first) == 1 and "'api'" in first[0]
+    assert checker._cache_path() == Path(os.environ["DCLIPSE_CACHE_DIR"]) / "doc_examples.json"
+    assert checker._cache_path().exists()
+
+    calls = _count_checks(checker, monkeypatch)
+    assert checker._check_files_cached([module_file]) == first
+    assert calls == []
+
+
+def test_cache_invalidated_by_file_mtime(checker, module_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    checker._check_files_cached([module_file])
+    module_file.write_text('def api():\n    """Examples: none."""\n', encoding="utf-8")
+    _bump_mtime(module_file)
+
+    calls = _count_checks(checker, monkeypatch)
+    assert checker._check_files_cached([module_file]) == []
+    assert calls == [module_file]
+
+
+def test_cache_invalidated_when_checker_changes(checker, module_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    checker._check_files_cached([module_file])
+    _bump_mtime(Path(checker.__file__))
+
+    calls = _count_checks(checker, monkeypatch)
+    checker._check_files_cached([module_file])
+    assert calls == [module_file]
+
+
+def test_no_cache_env_disables_cache(checker, module_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DCLIPSE_NO_CACHE", "1")
+    calls = _count_checks(checker, monkeypatch)
+    checker._check_files_cached([module_file])
+    checker._check_files_cached([module_file])
+    assert calls == [module_file, module_file]
+    assert not checker._cache_path().exists()
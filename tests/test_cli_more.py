@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+import os
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 
 from dclipse import cli
 
-if TYPE_CHECKING:  # pragma: no cover
-    from pathlib import Path
-
 
 def test_discover_config_path_env_var(monkeypatch, tmp_path: Path) -> None:
     cfg = tmp_path / "cfg.json"
@@ -37,6 +37,18 @@ def test_discover_config_path_missing(monkeypatch, tmp_path: Path) -> None:
         cli._discover_config_path(None)
 
 
+def test_discover_config_path_local_files(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("DCLIPSE_APP_CONFIG", raising=False)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".dclipse").mkdir()  # directories are not configs
+    (tmp_path / "dclipse").write_text("{}", encoding="utf-8")
+    assert cli._discover_config_path(None) == Path("dclipse")
+
+    # Large directories skip the scan and probe each candidate instead
+    monkeypatch.setattr(cli, "_SCANDIR_LIMIT", 0)
+    assert cli._discover_config_path(None) == Path("dclipse")
+
+
 def test_cmd_explain_text_prints_issues(monkeypatch, tmp_path: Path, capsys) -> None:
     # Build a minimal schema-valid config that will generate constraint issues.
     # Use an object with constraints but no selected keys so at_least_one_of triggers.
@@ -113,3 +125,73 @@ def test_cmd_list_styles(tmp_path: Path, monkeypatch, capsys) -> None:
     out = capsys.readouterr().out
     for s in cli.BUILTIN_STYLES:
         assert f"- {s}" in out
+
+
+def test_cmd_validate_reuses_cached_resolution(monkeypatch, tmp_path: Path, capsys) -> None:
+    cfg = {"global": {"options": {}}, "behavior": {}, "objects": {}, "actions": {}}
+    config_path = tmp_path / "example.json"
+    config_path.write_text(json.dumps(cfg), encoding="utf-8")
+    monkeypatch.setenv("DCLIPSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("DCLIPSE_NO_CACHE", raising=False)
+
+    assert cli.cmd_validate(str(config_path)) == 0
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    # An unchanged file is served from the cache without re-loading it
+    def boom(_path):
+        raise AssertionError("config should not be reloaded")
+
+    monkeypatch.setattr(cli, "load_config", boom)
+    assert cli.cmd_explain(str(config_path), fmt="json") == 0
+    assert '"objects"' in capsys.readouterr().out
+
+    # Editing the config replaces its single cache entry rather than adding another
+    monkeypatch.undo()
+    monkeypatch.setenv("DCLIPSE_CACHE_DIR", str(tmp_path / "cache"))
+    config_path.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    assert cli.cmd_validate(str(config_path)) == 0
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    # A change to the code files invalidates the entry (an absolute name overrides the
+    # package directory, so a scratch file stands in for resolver.py)
+    code_file = tmp_path / "resolver.py"
+    code_file.write_text("# v1\n", encoding="utf-8")
+    monkeypatch.setattr(cli, "_CACHE_CODE_FILES", (str(code_file),))
+    key = cli._cache_key(config_path)
+    code_file.write_text("# v2 edited\n", encoding="utf-8")
+    assert cli._cache_key(config_path) != key
+
+    # Bypassing the cache reloads the config
+    monkeypatch.setattr(cli, "load_config", boom)
+    monkeypatch.setenv("DCLIPSE_NO_CACHE", "1")
+    with pytest.raises(AssertionError):
+        cli.cmd_validate(str(config_path))
+
+
+def test_cmd_validate_cache_hit_skips_jsonschema(tmp_path: Path) -> None:
+    cfg = {"global": {"options": {}}, "behavior": {}, "objects": {}, "actions": {}}
+    config_path = tmp_path / "example.json"
+    config_path.write_text(json.dumps(cfg), encoding="utf-8")
+    code = (
+        "import sys; from dclipse import cli; "
+        f"cli.cmd_validate({str(config_path)!r}); print('jsonschema' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "DCLIPSE_CACHE_DIR": str(tmp_path / "cache")}
+    env.pop("DCLIPSE_NO_CACHE", None)
+    runs = [
+        subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True) for _ in "ab"
+    ]
+    assert [r.stdout.split()[-1] for r in runs] == ["True", "False"]
+
+
+def test_cache_key_schema_name_matches_schema_module() -> None:
+    from dclipse import schema
+
+    assert cli._CORE_SCHEMA_NAME == schema._CORE_SCHEMA_NAME
+
+
+def test_cli_import_defers_jsonschema_and_yaml() -> None:
+    code = "import sys, dclipse.cli; print('jsonschema' in sys.modules, 'yaml' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["False", "False"]
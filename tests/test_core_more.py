@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
-from io import StringIO
+import os
+import subprocess
+import sys
+from io import BytesIO, StringIO
 from typing import TYPE_CHECKING
 
 import pytest
@@ -56,3 +59,39 @@ def test_loads_guess_when_yaml_unavailable_raises(monkeypatch) -> None:
     monkeypatch.setattr(core, "yaml", None)
     with pytest.raises(RuntimeError):
         core._loads_guess("a: 1\n")
+
+
+def test_load_config_json_without_orjson(tmp_path: Path, monkeypatch) -> None:
+    # The stdlib parser is used when the optional orjson accelerator is missing
+    jpath = tmp_path / "c.json"
+    jpath.write_text('{"a": [1, 2]}', encoding="utf-8")
+    monkeypatch.setattr(core, "orjson", None)
+    assert core.load_config(jpath) == {"a": [1, 2]}
+    assert core._loads_guess('{"b": true}') == {"b": True}
+
+
+def test_load_config_from_binary_filelike_json(monkeypatch) -> None:
+    monkeypatch.setattr(core, "yaml", None)
+    assert core.load_config(BytesIO(b'  {"k": 1}')) == {"k": 1}
+    # Leading whitespace longer than the sniffed prefix still detects JSON
+    assert core._loads_guess(" " * 100 + "[1]") == [1]
+    assert core._loads_guess(b" " * 100 + b"[1]") == [1]
+
+
+def test_loads_guess_has_no_bytes_warning() -> None:
+    # Sniffing must not compare bytes with str, which warns under ``python -b``
+    code = "from dclipse import core; core._loads_guess(b'{}'); core._loads_guess('{}')"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    out = subprocess.run([sys.executable, "-b", "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert "BytesWarning" not in out.stderr
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"n": 123456789012345678901234567890}', '{"x": NaN, "y": -Infinity}', "[1e400]", '{"n": 1}'],
+)
+def test_json_loads_matches_stdlib_with_orjson(text: str) -> None:
+    pytest.importorskip("orjson")
+    expected = json.dumps(json.loads(text))
+    assert json.dumps(core.json_loads(text)) == expected
+    assert json.dumps(core.json_loads(text.encode("utf-8"))) == expected
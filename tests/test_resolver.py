@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 
+import pytest
+
+from dclipse import resolver
 from dclipse.core import load_config
-from dclipse.resolver import resolve_config
+from dclipse.resolver import (
+    ResolutionError,
+    _json_pointer_get,
+    _merge,
+    _render_vars_in_obj,
+    resolve_config,
+)
 
 
 def test_resolve_example_config() -> None:
@@ -13,3 +23,91 @@ def test_resolve_example_config() -> None:
     assert isinstance(res.resolved, dict)
     # ensure refs and vars (if present) render without raising
     assert isinstance(res.issues, list)
+
+
+def test_resolve_refs_vars_and_constraints_in_one_pass() -> None:
+    cfg = {
+        "global": {"options": {}},
+        "behavior": {},
+        "shared_defs": {
+            "vars": {"name": "demo"},
+            "actions": {"base": {"names": ["base"], "description_short": "{{vars.name}} base"}},
+        },
+        "objects": {
+            "obj": {
+                "names": ["obj"],
+                "description_short": "{{vars.name}} obj",
+                "constraints": {"requires": ["x"]},
+                "actions": {
+                    "act": {
+                        "$ref": "#/shared_defs/actions/base",
+                        "constraints": {"at_least_one_of": [["a", "b"]]},
+                    },
+                },
+            },
+        },
+        "actions": {"top": {"names": ["top"], "description_short": "d", "constraints": {"requires": ["y"]}}},
+    }
+    res = resolve_config(cfg)
+    act = res.resolved["objects"]["obj"]["actions"]["act"]
+    assert "$ref" not in act
+    assert act["description_short"] == "demo base"
+    assert res.resolved["objects"]["obj"]["description_short"] == "demo obj"
+    # raw input is left untouched
+    assert cfg["objects"]["obj"]["description_short"] == "{{vars.name}} obj"
+    assert res.issues == [
+        "object obj: requires: missing x",
+        "object obj action act: at_least_one_of violation: ['a', 'b']",
+        "action top: requires: missing y",
+    ]
+
+
+def test_json_pointer_get_escapes_and_errors() -> None:
+    doc = {"a/b": {"c~d": 1}, "x": {"y": 2}}
+    assert _json_pointer_get(doc, "#") is doc
+    assert _json_pointer_get(doc, "#/x/y") == 2
+    assert _json_pointer_get(doc, "#/a~1b/c~0d") == 1
+    assert resolver._pointer_tokens("#/~01") == ("~1",)
+    for bad in ("x/y", "#x", "#/", "#/x//y"):
+        with pytest.raises(ResolutionError, match="Unsupported"):
+            _json_pointer_get(doc, bad)
+    with pytest.raises(ResolutionError, match="Invalid"):
+        _json_pointer_get(doc, "#/x/z")
+
+
+def test_merge_nested_overrides_without_mutating_inputs() -> None:
+    a = {"x": {"y": {"z": 1, "keep": True}, "l": [1]}, "s": "a"}
+    b = {"x": {"y": {"z": 2}, "l": [2]}, "t": "b"}
+    out = _merge(a, b)
+    assert out == {"x": {"y": {"z": 2, "keep": True}, "l": [2]}, "s": "a", "t": "b"}
+    assert a["x"]["y"]["z"] == 1
+
+
+def test_render_vars_in_obj_handles_builtin_subclasses() -> None:
+    class Text(str):
+        pass
+
+    obj = OrderedDict(a=[Text("{{vars.x}}"), 1, None, 2.5, True], b=("{{vars.x}}",))
+    out = _render_vars_in_obj(obj, {"x": "X"})
+    assert out == {"a": ["X", 1, None, 2.5, True], "b": ("{{vars.x}}",)}
+    assert type(out) is dict
+
+
+def test_expand_ref_memoizes_pointer_targets(monkeypatch) -> None:
+    doc = {"shared_defs": {"base": {"names": ["b"]}, "scalar": "x"}}
+    calls: list[str] = []
+    real_get = resolver._json_pointer_get
+
+    def counting_get(d, pointer):
+        calls.append(pointer)
+        return real_get(d, pointer)
+
+    monkeypatch.setattr(resolver, "_json_pointer_get", counting_get)
+    cache: dict = {}
+    a = resolver._expand_ref(doc, {"$ref": "#/shared_defs/base", "x": 1}, cache)
+    b = resolver._expand_ref(doc, {"$ref": "#/shared_defs/base", "x": 2}, cache)
+    assert (a["x"], b["x"]) == (1, 2)
+    assert a["names"] == ["b"]
+    assert calls == ["#/shared_defs/base"]
+    with pytest.raises(ResolutionError, match="must point to a mapping"):
+        resolver._expand_ref(doc, {"$ref": "#/shared_defs/scalar"}, cache)
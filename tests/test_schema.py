@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from dclipse import schema
 from dclipse.core import load_config
 from dclipse.schema import validate_core_config
 
@@ -16,3 +17,8 @@ def test_example_config_validates() -> None:
     # sanity on structure
     assert isinstance(cfg, dict)
     assert "objects" in cfg or "actions" in cfg
+
+
+def test_validators_are_built_once() -> None:
+    assert schema._validator("core") is schema._validator("core")
+    assert schema._validator("style") is not schema._validator("core")
@@ -63,3 +63,63 @@ def test_load_style_errors_for_missing_and_invalid_py(tmp_path: Path, monkeypatc
     py.write_text("STYLE_NAME='x'\n# no render here\n", encoding="utf-8")
     with pytest.raises(TypeError):
         style_loader.load_style(explicit_path=py)
+
+
+def test_discover_style_path_tracks_file_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv("DCLIPSE_STYLE_FILE", raising=False)
+    (tmp_path / ".git").mkdir()
+    assert style_loader.discover_style_path(explicit_path=None, cwd=tmp_path) is None
+
+    # A newly created style file is found
+    style = tmp_path / ".dclipse_style.yaml"
+    style.write_text("{}", encoding="utf-8")
+    assert style_loader.discover_style_path(explicit_path=None, cwd=tmp_path) == style.resolve()
+
+    # A higher-priority file created later wins over the earlier hit
+    py_style = tmp_path / ".dclipse_style.py"
+    py_style.write_text("", encoding="utf-8")
+    assert style_loader.discover_style_path(explicit_path=None, cwd=tmp_path) == py_style.resolve()
+
+    # ...and so does a DCLIPSE_STYLE_FILE target that appears later
+    env_style = tmp_path / "custom.json"
+    monkeypatch.setenv("DCLIPSE_STYLE_FILE", str(env_style))
+    assert style_loader.discover_style_path(explicit_path=None, cwd=tmp_path) == py_style.resolve()
+    env_style.write_text("{}", encoding="utf-8")
+    assert style_loader.discover_style_path(explicit_path=None, cwd=tmp_path) == env_style.resolve()
+
+    # Removed files are no longer returned
+    monkeypatch.delenv("DCLIPSE_STYLE_FILE")
+    style.unlink()
+    py_style.unlink()
+    assert style_loader.discover_style_path(explicit_path=None, cwd=tmp_path) is None
+
+
+def test_discover_style_path_project_root_priority(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv("DCLIPSE_STYLE_FILE", raising=False)
+    (tmp_path / ".git").mkdir()
+    for name in (".dclipse_style.yml", ".dclipse_style.json", ".dclipse_style.txt"):
+        (tmp_path / name).write_text("{}", encoding="utf-8")
+    found = style_loader.discover_style_path(explicit_path=None, cwd=tmp_path)
+    assert found == (tmp_path / ".dclipse_style.json").resolve()
+
+
+def test_discover_project_root_memoizes_git_probes(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    (root / ".git").mkdir(parents=True)
+    a = root / "a" / "deep"
+    b = root / "b"
+    a.mkdir(parents=True)
+    b.mkdir()
+    assert style_loader._discover_project_root(a) == root.resolve()
+    misses = style_loader._has_git_entry.cache_info().misses
+    # A sibling directory reuses the probes made for the shared parents: only ``b`` is new
+    assert style_loader._discover_project_root(b) == root.resolve()
+    assert style_loader._has_git_entry.cache_info().misses == misses + 1
+
+
+def test_discover_style_path_env_expands_user(tmp_path: Path, monkeypatch) -> None:
+    style = tmp_path / "style.json"
+    style.write_text("{}", encoding="utf-8")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("DCLIPSE_STYLE_FILE", "~/style.json")
+    assert style_loader.discover_style_path(explicit_path=None, cwd=tmp_path) == style
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import datetime as dt
 import json
 from typing import TYPE_CHECKING
 
 import pytest
 from jsonschema import ValidationError
 
+from dclipse import schema, style_loader
 from dclipse.schema import load_and_validate_style_file
 from dclipse.style_loader import discover_style_path, load_style
 
@@ -73,3 +75,76 @@ def test_style_validation_error(tmp_path: Path) -> None:
     bad.write_text(json.dumps({"name": "oops"}), encoding="utf-8")  # missing required sections
     with pytest.raises(ValidationError):
         load_and_validate_style_file(bad)
+
+
+def test_style_validator_compiled_once_across_loads(tmp_path: Path) -> None:
+    p = tmp_path / ".dclipse_style.json"
+    p.write_text(json.dumps(_MINIMAL_JSON), encoding="utf-8")
+    load_and_validate_style_file(p)
+    misses = schema._validator.cache_info().misses
+    for _ in range(3):
+        load_and_validate_style_file(p)
+    assert schema._validator.cache_info().misses == misses
+
+
+def test_style_cache_sidecar_skips_reparse(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    p = tmp_path / ".dclipse_style.yaml"
+    p.write_text(_MINIMAL_YAML, encoding="utf-8")
+    monkeypatch.setenv("DCLIPSE_STYLE_CACHE", "1")
+
+    assert load_style(explicit_path=p).config["name"] == "aws-cli-like"
+    assert (tmp_path / ".dclipse_style.yaml.cache.json").exists()
+    assert not list(tmp_path.glob("*.tmp.*"))
+
+    def boom(_path):
+        raise AssertionError("style should be served from the sidecar")
+
+    monkeypatch.setattr(schema, "load_and_validate_style_file", boom)
+    style_loader._load_style_cached.cache_clear()  # bypass the in-process cache to exercise the sidecar
+    assert load_style(explicit_path=p).config["name"] == "aws-cli-like"
+
+    # Editing the style file invalidates the sidecar
+    p.write_text(_MINIMAL_YAML.replace("aws-cli-like", "edited"), encoding="utf-8")
+    with pytest.raises(AssertionError):
+        load_style(explicit_path=p)
+
+
+@pytest.mark.parametrize(
+    ("extensions", "expected"),
+    [("{released: 2024-01-01}", {"released": dt.date(2024, 1, 1)}), ("{1: x}", {1: "x"})],
+)
+def test_style_cache_sidecar_skips_non_json_configs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    extensions: str,
+    expected: dict,
+) -> None:
+    p = tmp_path / ".dclipse_style.yaml"
+    p.write_text(_MINIMAL_YAML + f"extensions: {extensions}\n", encoding="utf-8")
+    monkeypatch.setenv("DCLIPSE_STYLE_CACHE", "1")
+
+    assert load_style(explicit_path=p).config["extensions"] == expected
+    assert not (tmp_path / ".dclipse_style.yaml.cache.json").exists()
+
+    style_loader._load_style_cached.cache_clear()
+    assert load_style(explicit_path=p).config["extensions"] == expected
+
+
+def test_load_style_reuses_loaded_style_until_file_changes(tmp_path: Path) -> None:
+    p = tmp_path / ".dclipse_style.json"
+    p.write_text(json.dumps(_MINIMAL_JSON), encoding="utf-8")
+    first = load_style(explicit_path=p)
+    hits = style_loader._load_style_cached.cache_info().hits
+    assert load_style(explicit_path=p) == first
+    assert style_loader._load_style_cached.cache_info().hits == hits + 1
+
+    p.write_text(json.dumps({**_MINIMAL_JSON, "name": "edited-style"}), encoding="utf-8")
+    assert load_style(explicit_path=p).name == "edited-style"
+
+
+def test_load_style_returns_independent_configs(tmp_path: Path) -> None:
+    p = tmp_path / ".dclipse_style.json"
+    p.write_text(json.dumps(_MINIMAL_JSON), encoding="utf-8")
+    first = load_style(explicit_path=p)
+    first.config["options"]["long_prefix"] = "++"
+    assert load_style(explicit_path=p).config["options"]["long_prefix"] == "--"
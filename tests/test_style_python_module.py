@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import pytest
 
-from dclipse.style_loader import discover_style_path, load_style
+from dclipse.style_loader import LoadedStyle, discover_style_path, load_style
 
 if TYPE_CHECKING:  # pragma: no cover - typing-only import
     from pathlib import Path
@@ -57,3 +58,30 @@ def test_python_style_missing_render(tmp_path: Path, monkeypatch: pytest.MonkeyP
     with pytest.raises(TypeError) as ei:
         _ = load_style()  # importing module without render()
     assert "render" in str(ei.value)
+
+
+def test_python_style_module_reused_until_file_changes(tmp_path: Path) -> None:
+    mod = tmp_path / ".dclipse_style.py"
+    mod.write_text(_MINIMAL_STYLE_PY, encoding="utf-8")
+
+    first = load_style(explicit_path=mod)
+    assert load_style(explicit_path=mod).module is first.module
+
+    mod.write_text(_MINIMAL_STYLE_PY.replace("custom-minimal", "custom-edited"), encoding="utf-8")
+    edited = load_style(explicit_path=mod)
+    assert edited.module is not first.module
+    assert edited.name == "custom-edited"
+
+
+def test_loaded_style_render_without_cached_fn(tmp_path: Path) -> None:
+    def render(resolved_model, *, package_name, engine=None):
+        return {}
+
+    common = {"name": "s", "source": tmp_path / "s.py", "config": None}
+    ok = LoadedStyle(is_python_module=True, module=SimpleNamespace(render=render), **common)
+    assert ok.render() is render
+
+    with pytest.raises(TypeError):
+        LoadedStyle(is_python_module=True, module=SimpleNamespace(), **common).render()
+    with pytest.raises(RuntimeError):
+        LoadedStyle(is_python_module=False, module=None, **common).render()
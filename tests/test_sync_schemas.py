@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "tools" / "sync_schemas.py"
+
+
+@pytest.fixture
+def sync(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    spec = importlib.util.spec_from_file_location("sync_schemas", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+
+    src = tmp_path / "src" / "dclipse" / "schema"
+    src.mkdir(parents=True)
+    (src / "a.schema.json").write_text(json.dumps({"a": 1}), encoding="utf-8")
+    (src / "b.schema.json").write_text(json.dumps({"b": 2}), encoding="utf-8")
+    (src / "notes.txt").write_text("ignored", encoding="utf-8")
+    (tmp_path / "tools").mkdir()
+    monkeypatch.setattr(mod, "ROOT", tmp_path)
+    monkeypatch.setattr(mod, "SRC_DIR", src)
+    monkeypatch.setattr(mod, "DEST_REPO", tmp_path / "schema")
+    monkeypatch.setattr(mod, "DEST_DOCS", tmp_path / "docs" / "schema")
+    monkeypatch.setattr(mod, "CACHE_FILE", tmp_path / "tools" / ".schema_sync_cache.json")
+    monkeypatch.setattr(mod, "STAMP_FILE", tmp_path / "tools" / ".schema_sync.stamp")
+    return mod
+
+
+def test_write_then_check_passes(sync, tmp_path: Path) -> None:
+    assert sync.main(["--check"]) == 1
+    assert not (tmp_path / "schema").exists()  # check mode writes nothing
+
+    assert sync.main(["--jobs", "1"]) == 0
+    for dest in (tmp_path / "schema", tmp_path / "docs" / "schema"):
+        assert sorted(p.name for p in dest.iterdir()) == ["a.schema.json", "b.schema.json"]
+        assert not list(dest.glob("*.tmp.*"))
+    assert sync.STAMP_FILE.exists()
+    assert set(json.loads(sync.CACHE_FILE.read_text(encoding="utf-8"))) == {
+        "schema/a.schema.json",
+        "schema/b.schema.json",
+        "docs/schema/a.schema.json",
+        "docs/schema/b.schema.json",
+    }
+    assert sync.main(["--check"]) == 0
+
+
+def test_check_fails_for_edited_destination_despite_stamp(sync, tmp_path: Path) -> None:
+    assert sync.main([]) == 0
+    assert sync.STAMP_FILE.exists()
+
+    (tmp_path / "docs" / "schema" / "a.schema.json").write_text('{"a": 2}', encoding="utf-8")
+    assert sync.main(["--check"]) == 1
+
+    assert sync.main([]) == 0
+    assert (tmp_path / "docs" / "schema" / "a.schema.json").read_text(encoding="utf-8") == '{"a": 1}'
+    assert sync.main(["--check"]) == 0
+
+
+def test_check_fails_for_missing_destination(sync, tmp_path: Path) -> None:
+    assert sync.main([]) == 0
+    (tmp_path / "schema" / "b.schema.json").unlink()
+    assert sync.main(["--check"]) == 1
+
+
+def test_manifest_hit_skips_hashing(sync, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert sync.main([]) == 0
+    sync.STAMP_FILE.unlink()  # force the per-file path
+
+    def boom(_path):
+        raise AssertionError("manifest hits must not open source or destination files")
+
+    monkeypatch.setattr(sync, "_digest", boom)
+    assert sync.main(["--check"]) == 0
+
+
+def test_each_source_hashed_at_most_once(sync, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    digest = sync._digest
+
+    def counting(path: Path) -> str:
+        calls.append(path.as_posix())
+        return digest(path)
+
+    monkeypatch.setattr(sync, "_digest", counting)
+    assert sync.main(["--jobs", "4"]) == 0  # fresh copies: each source hashed once for the manifest
+    sources = [c for c in calls if "/src/" in c]
+    assert sorted(sources) == sorted(set(sources)) and len(sources) == 2
+
+
+def test_failed_copy_removes_temp_file(sync, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import shutil
+
+    def fail(_src, dst):
+        Path(dst).write_text("partial", encoding="utf-8")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(shutil, "copyfile", fail)
+    with pytest.raises(OSError, match="disk full"):
+        sync.main(["--jobs", "1"])
+    assert not list((tmp_path / "schema").iterdir())
+    assert not sync.STAMP_FILE.exists()
+
+
+def test_missing_source_dir_is_a_no_op(sync, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sync, "SRC_DIR", tmp_path / "absent")
+    assert sync.main(["--check"]) == 0
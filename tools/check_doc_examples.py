@@ -10,10 +10,17 @@ Rules:
 
 Usage (pre-commit passes changed file paths as argv):
     tools/check_doc_examples.py FILE [FILE ...]
+
+Results are cached per file in ``doc_examples.json`` under the dclipse cache directory
+(``$DCLIPSE_CACHE_DIR``, else ``$XDG_CACHE_HOME/dclipse``, else ``~/.cache/dclipse``),
+keyed by modification time, so unchanged files are not re-parsed.
+Set ``DCLIPSE_NO_CACHE`` to disable the cache.
 """
 from __future__ import annotations
 
 import ast
+import json
+import os
 import sys
 from typing import TYPE_CHECKING
 
@@ -21,18 +28,18 @@ if TYPE_CHECKING:  # pragma: no cover - typing-only
     from collections.abc import Iterable
 from pathlib import Path
 
+_SKIP_PARTS = frozenset({"tests", "examples"})
+# Limit enforcement to core modules to start; expand over time
+_ALLOWED_NAMES = frozenset({"core.py", "resolver.py", "style_loader.py", "instructions.py", "__init__.py"})
+
 
 def _is_python_file(path: Path) -> bool:
     return path.suffix == ".py"
 
 
 def _should_skip(path: Path) -> bool:
-    parts = path.parts
-    if any(p in {"tests", "examples"} for p in parts):
-        return True
-    # Limit enforcement to core modules to start; expand over time
-    allowed = {"core.py", "resolver.py", "style_loader.py", "instructions.py", "__init__.py"}
-    return path.name not in allowed
+    # Cheap name lookup first; the parts scan only runs for allowed module names
+    return path.name not in _ALLOWED_NAMES or not _SKIP_PARTS.isdisjoint(path.parts)
 
 
 def _has_examples(doc: str | None) -> bool:
@@ -78,6 +85,60 @@ def check_file(path: Path) -> list[str]:
     return failures
 
 
+def _cache_path() -> Path:
+    # Same directory rule as the dclipse CLI's resolution cache
+    env_val = os.getenv("DCLIPSE_CACHE_DIR")
+    if env_val:
+        return Path(env_val).expanduser() / "doc_examples.json"
+    return Path(os.getenv("XDG_CACHE_HOME") or "~/.cache").expanduser() / "dclipse" / "doc_examples.json"
+
+
+def _load_cache(checker_mtime_ns: int) -> dict[str, dict]:
+    """Load cached results, discarding them if this checker script has changed since."""
+    try:
+        data = json.loads(_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("checker_mtime_ns") != checker_mtime_ns:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(checker_mtime_ns: int, files: dict[str, dict]) -> None:
+    path = _cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"checker_mtime_ns": checker_mtime_ns, "files": files}), encoding="utf-8")
+    except OSError:
+        pass  # caching is best-effort
+
+
+def _check_files_cached(paths: list[Path]) -> list[str]:
+    """Run ``check_file`` on ``paths``, reusing cached results for unchanged files."""
+    if os.getenv("DCLIPSE_NO_CACHE"):
+        return [msg for p in paths for msg in check_file(p)]
+
+    checker_mtime_ns = Path(__file__).stat().st_mtime_ns
+    cache = _load_cache(checker_mtime_ns)
+    failures: list[str] = []
+    dirty = False
+    for p in paths:
+        key = str(p.resolve())
+        mtime_ns = p.stat().st_mtime_ns
+        entry = cache.get(key)
+        if isinstance(entry, dict) and entry.get("mtime_ns") == mtime_ns and entry.get("path") == str(p):
+            failures.extend(entry.get("failures", []))
+            continue
+        result = check_file(p)
+        cache[key] = {"mtime_ns": mtime_ns, "path": str(p), "failures": result}
+        dirty = True
+        failures.extend(result)
+    if dirty:
+        _save_cache(checker_mtime_ns, cache)
+    return failures
+
+
 def main(argv: list[str]) -> int:
     """Entrypoint for pre-commit: process changed files and report failures.
 
@@ -95,10 +156,8 @@ def main(argv: list[str]) -> int:
             args.append(a)
 
     files = [Path(a) for a in args]
-    py_files = [p for p in files if _is_python_file(p) and not _should_skip(p) and str(p).startswith("src/")]
-    failures: list[str] = []
-    for p in py_files:
-        failures.extend(check_file(p))
+    py_files = [p for p in files if _is_python_file(p) and str(p).startswith("src/") and not _should_skip(p)]
+    failures = _check_files_cached(py_files)
 
     if failures:
         for msg in failures:
@@ -5,41 +5,164 @@
 - Destinations:    schema/*.json and docs/schema/*.json
 
 Usage:
-  python tools/sync_schemas.py [--check]
+  python tools/sync_schemas.py [--check] [--jobs N]
 
 When --check is provided, the script exits with non-zero status if any destination
 would change (no files are written). This is suitable for CI or pre-commit.
+
+Pairs verified as identical are recorded in tools/.schema_sync_cache.json with the
+size and mtime of both files, so later runs skip reading files whose stats are unchanged.
+A fingerprint of all those stats is also kept in tools/.schema_sync.stamp; when it still
+matches, the run ends after a single stat per file.
+
+The script does not rely on assert statements or docstrings at runtime, so it is safe
+to run under ``python -O`` (as the pre-commit hook does).
 """
 from __future__ import annotations
 
-import filecmp
+import argparse
+import hashlib
+import json
+import os
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable
+
+try:  # optional: BLAKE3 is considerably faster than sha256 when installed
+    from blake3 import blake3 as _hasher
+except ImportError:  # pragma: no cover - depends on environment
+    _hasher = hashlib.sha256
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT / "src" / "dclipse" / "schema"
 DEST_REPO = ROOT / "schema"
 DEST_DOCS = ROOT / "docs" / "schema"
+CACHE_FILE = ROOT / "tools" / ".schema_sync_cache.json"
+STAMP_FILE = ROOT / "tools" / ".schema_sync.stamp"
+
 
+def _load_cache() -> dict[str, dict[str, Any]]:
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
 
-def copy_if_different(src: Path, dest: Path, *, check: bool) -> bool:
+
+def _save_cache(cache: dict[str, dict[str, Any]]) -> None:
+    try:
+        CACHE_FILE.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+    except OSError:
+        pass  # caching is best-effort
+
+
+def _tree_stamp(entries: list[os.DirEntry[str]]) -> str | None:
+    """Fingerprint the stats of every source and its copies; None if a copy is missing."""
+    parts = []
+    for entry in sorted(entries, key=lambda e: e.name):
+        src_st = entry.stat()
+        parts.append(f"{entry.name}:{src_st.st_size}:{src_st.st_mtime_ns}")
+        for dest_dir in (DEST_REPO, DEST_DOCS):
+            try:
+                st = (dest_dir / entry.name).stat()
+            except FileNotFoundError:
+                return None
+            parts.append(f"{st.st_size}:{st.st_mtime_ns}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _digest(path: Path) -> str:
+    """Return the hex content digest of a file (BLAKE3 if available, else sha256)."""
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, _hasher).hexdigest()
+        return _hasher(f.read()).hexdigest()
+
+
+def _stat_key(src_st: os.stat_result, dest_st: os.stat_result) -> dict[str, int]:
+    return {
+        "src_size": src_st.st_size,
+        "src_mtime_ns": src_st.st_mtime_ns,
+        "dest_size": dest_st.st_size,
+        "dest_mtime_ns": dest_st.st_mtime_ns,
+    }
+
+
+class _LazyDigest:
+    """Digest of one source file, computed on first use and shared by its destinations."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._value: str | None = None
+
+    def __call__(self) -> str:
+        with self._lock:
+            if self._value is None:
+                self._value = _digest(self._path)
+            return self._value
+
+
+def copy_if_different(
+    src: Path,
+    dest: Path,
+    *,
+    check: bool,
+    cache: dict[str, dict[str, Any]] | None = None,
+    src_digest: Callable[[], str] | None = None,
+    src_stat: os.stat_result | None = None,
+) -> bool:
     """Copy file if contents differ.
 
     Args:
         src: Source file path.
-        dest: Destination file path.
+        dest: Destination file path; its directory must already exist when writing.
         check: If True, do not write; only report whether a change would occur.
+        cache: Optional manifest of pairs known to be identical, keyed by destination.
+            A matching entry skips the content comparison; it is updated in place.
+        src_digest: Callable returning the content digest of ``src``; it is only called
+            when a pair misses the manifest and the sizes agree (or after a copy), so a
+            shared, memoizing callable reads each source at most once. Defaults to
+            hashing ``src`` directly.
+        src_stat: Precomputed stat of ``src`` (e.g. from ``os.scandir``).
 
     Returns:
         True if a change occurred (or would occur in check mode); False otherwise.
     """
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    if dest.exists() and filecmp.cmp(src, dest, shallow=False):
-        return False  # no change
+    key = dest.relative_to(ROOT).as_posix()
+    src_st = src_stat if src_stat is not None else src.stat()
+    try:
+        dest_st: os.stat_result | None = dest.stat()
+    except FileNotFoundError:
+        dest_st = None
+    if dest_st is not None:
+        entry = cache.get(key) if cache is not None else None
+        if entry and all(entry.get(k) == v for k, v in _stat_key(src_st, dest_st).items()):
+            return False  # unchanged since last verified
+        # A size mismatch means the contents differ; only hash when sizes agree.
+        if dest_st.st_size == src_st.st_size:
+            digest = src_digest() if src_digest is not None else _digest(src)
+            if _digest(dest) == digest:
+                if cache is not None:
+                    cache[key] = {**_stat_key(src_st, dest_st), "src_digest": digest}
+                return False  # no change
     if check:
         return True  # would change
-    shutil.copy2(src, dest)
+    # Copy to a sibling temp file and rename over the destination, so an interrupted
+    # run never leaves a truncated schema behind.
+    tmp = dest.with_name(f"{dest.name}.tmp.{os.getpid()}")
+    try:
+        shutil.copyfile(src, tmp)
+        tmp.replace(dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if cache is not None:
+        digest = src_digest() if src_digest is not None else _digest(src)
+        cache[key] = {**_stat_key(src_st, dest.stat()), "src_digest": digest}
     return True
 
 
@@ -47,16 +170,72 @@ def main(argv: list[str]) -> int:
     """Entry point for schema sync utility.
 
     Supports a "--check" flag to verify that destination copies are up to date
-    without modifying files, returning non-zero when they are not.
+    without modifying files, returning non-zero when they are not, and "--jobs"
+    to bound the number of worker threads.
     """
-    check = "--check" in argv
+    parser = argparse.ArgumentParser(description="Sync packaged JSON Schemas to repo-level copies.")
+    parser.add_argument("--check", action="store_true", help="report out-of-date copies without writing")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(32, (os.cpu_count() or 1) * 2),
+        help="maximum number of worker threads (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    check = args.check
+    if not SRC_DIR.is_dir():
+        return 0  # nothing to sync (e.g. partial checkout)
     changed = False
 
-    for src in SRC_DIR.glob("*.json"):
+    # One directory scan yields the sources with their stats. If neither they nor their
+    # copies changed since the last run that left everything in sync, stop here.
+    with os.scandir(SRC_DIR) as it:
+        entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+    stamp = _tree_stamp(entries)
+    try:
+        if stamp is not None and STAMP_FILE.read_text(encoding="utf-8") == stamp:
+            return 0
+    except OSError:
+        pass
+
+    if not check:
+        # Create each destination directory once rather than per copied file.
         for dest_dir in (DEST_REPO, DEST_DOCS):
-            dest = dest_dir / src.name
-            if copy_if_different(src, dest, check=check):
-                changed = True
+            dest_dir.mkdir(parents=True, exist_ok=True)
+    cache = _load_cache()
+    before = json.dumps(cache, sort_keys=True)
+
+    # A source is hashed at most once, and only if some destination needs the comparison.
+    sources = [(Path(e.path), e.stat(), _LazyDigest(Path(e.path))) for e in entries]
+
+    tasks = [
+        (src, dest_dir / src.name, src_st, digest)
+        for src, src_st, digest in sources
+        for dest_dir in (DEST_REPO, DEST_DOCS)
+    ]
+
+    # Pairs are independent and the work is syscall-bound, so run them concurrently.
+    # Each task writes a distinct cache key, which is safe to do from several threads.
+    def _sync(task: tuple[Path, Path, os.stat_result, _LazyDigest]) -> bool:
+        src, dest, src_st, digest = task
+        return copy_if_different(src, dest, check=check, cache=cache, src_digest=digest, src_stat=src_st)
+
+    if tasks:
+        with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(tasks)))) as pool:
+            changed = any(list(pool.map(_sync, tasks)))
+
+    # Entries only describe verified-identical pairs, so they are safe to keep in check mode too.
+    if json.dumps(cache, sort_keys=True) != before:
+        _save_cache(cache)
+
+    if not (check and changed):
+        # Everything is in sync now; record it (copies may have new stats after writing).
+        stamp = _tree_stamp(entries)
+        if stamp is not None:
+            try:
+                STAMP_FILE.write_text(stamp, encoding="utf-8")
+            except OSError:
+                pass  # best-effort, like the manifest
 
     if check and changed:
         print("Schema sync check failed: destinations are out of date.")